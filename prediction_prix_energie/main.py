@@ -21,7 +21,8 @@ from src.modeling.predictor import make_predictions
 from src.backtesting.strategy_simulator import simulate_hedging_strategy
 from src.backtesting.performance_analyzer import calculate_pnl, calculate_backtest_metrics
 from src.reporting.visualizer import plot_predictions_vs_actual, plot_feature_importance, plot_cumulative_pnl
-from src.reporting.report_generator import generate_price_prediction_report
+from src.reporting.report_engine import ReportEngine
+from src.utils.config import Config
 
 def run_price_prediction_project():
     logger.info("Démarrage du projet de prédiction des prix de l'énergie.")
@@ -86,43 +87,40 @@ def run_price_prediction_project():
     best_xgboost_model = train_xgboost_model(X_train, y_train)
     save_model(best_xgboost_model, model_path)
 
-    # --- 4. Prédiction ---
-    logger.info("Génération des prédictions.")
-    y_pred = make_predictions(best_xgboost_model, X_test)
-
-    # --- 5. Évaluation du Modèle ---
-    logger.info("Évaluation du modèle.")
-    model_metrics = evaluate_model(y_test, y_pred)
-
-    # --- 6. Backtest ---
-    logger.info("Démarrage du backtest.")
-    simulation_results = simulate_hedging_strategy(y_test, y_pred)
-    pnl_df = calculate_pnl(simulation_results['cost_strategy'], simulation_results['cost_benchmark'])
-    backtest_metrics = calculate_backtest_metrics(pnl_df['daily_pnl'])
-
-    # --- 7. Visualisation et Rapport ---
-    logger.info("Génération des visualisations et du rapport.")
-    reports_dir = 'reports'
-    os.makedirs(reports_dir, exist_ok=True)
-
-    plot_predictions_vs_actual(y_test, y_pred, 'Prédictions vs Réalité des Prix de l\'Électricité', 
-                               os.path.join(reports_dir, 'predictions_vs_actual.png'))
-    
-    # Feature importance (nécessite un modèle qui expose feature_importances_)
-    if hasattr(best_xgboost_model, 'feature_importances_'):
-        feature_importances = pd.Series(best_xgboost_model.feature_importances_, index=X_train.columns)
-        plot_feature_importance(feature_importances, 'Importance des Caractéristiques', 
-                                os.path.join(reports_dir, 'feature_importance.png'))
-
-    plot_cumulative_pnl(pnl_df['cumulative_pnl'], 'PnL Cumulé de la Stratégie de Hedging', 
-                        os.path.join(reports_dir, 'cumulative_pnl.png'))
-
-    generate_price_prediction_report(model_metrics, backtest_metrics, 
-                                     os.path.join(reports_dir, 'price_prediction_report.md'))
+    # Le rendu des graphiques tourne dans un pool de processus et ne bloque pas la suite du pipeline;
+    # le bloc `with` garantit l'arrêt du pool même si une étape suivante échoue.
+    with ReportEngine(Config.REPORTS_DIR, max_workers=Config.REPORT_MAX_WORKERS) as report_engine:
+        # Feature importance (nécessite un modèle qui expose feature_importances_)
+        if hasattr(best_xgboost_model, 'feature_importances_'):
+            feature_importances = pd.Series(best_xgboost_model.feature_importances_, index=X_train.columns)
+            report_engine.submit_chart('feature_importance', 'Importance des Caractéristiques',
+                                       plot_feature_importance, feature_importances)
+
+        # --- 4. Prédiction ---
+        logger.info("Génération des prédictions.")
+        y_pred = make_predictions(best_xgboost_model, X_test)
+        report_engine.submit_chart('predictions_vs_actual', 'Prédictions vs Réalité des Prix de l\'Électricité',
+                                   plot_predictions_vs_actual, y_test, y_pred, max_points=Config.CHART_MAX_POINTS)
+
+        # --- 5. Évaluation du Modèle ---
+        logger.info("Évaluation du modèle.")
+        model_metrics = evaluate_model(y_test, y_pred)
+
+        # --- 6. Backtest ---
+        logger.info("Démarrage du backtest.")
+        simulation_results = simulate_hedging_strategy(y_test, y_pred)
+        pnl_df = calculate_pnl(simulation_results['cost_strategy'], simulation_results['cost_benchmark'])
+        backtest_metrics = calculate_backtest_metrics(pnl_df['daily_pnl'])
+        report_engine.submit_chart('cumulative_pnl', 'PnL Cumulé de la Stratégie de Hedging',
+                                   plot_cumulative_pnl, pnl_df['cumulative_pnl'], max_points=Config.CHART_MAX_POINTS)
+
+        # --- 7. Rapport ---
+        logger.info("Finalisation des visualisations et du rapport.")
+        report_engine.add_section("Performance du Modèle", model_metrics)
+        report_engine.add_section("Performance du Backtest", backtest_metrics)
+        report_engine.finalize('price_prediction_report')
 
     logger.info("Projet de prédiction des prix de l'énergie terminé.")
 
 if __name__ == "__main__":
     run_price_prediction_project()
-
-
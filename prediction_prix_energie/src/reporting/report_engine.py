@@ -0,0 +1,218 @@
+import os
+import json
+import hashlib
+import logging
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor, wait
+import numpy as np
+import pandas as pd
+
+from src.reporting.report_generator import write_markdown_report, write_html_report
+
+logger = logging.getLogger(__name__)
+
+CACHE_FILE_NAME = ".chart_cache.json"
+
+# Modules chargés une seule fois par le serveur forkserver, puis hérités par chaque worker.
+# "__main__" y figure pour que les workers ne ré-exécutent pas le script principal chacun;
+# certaines versions de CPython (dont 3.11) ignorent ce préchargement, les workers
+# ré-importent alors le script principal au démarrage.
+WORKER_PRELOAD_MODULES = ["__main__", "matplotlib", "seaborn", "src.reporting.visualizer"]
+
+def _init_worker():
+    import matplotlib
+    matplotlib.use("Agg")
+
+def _update_hash(hasher, obj):
+    if isinstance(obj, (pd.Series, pd.DataFrame, pd.Index)):
+        hasher.update(type(obj).__name__.encode())
+        hasher.update(pd.util.hash_pandas_object(obj, index=True).to_numpy().tobytes())
+        if isinstance(obj, pd.DataFrame):
+            hasher.update(repr(list(obj.columns)).encode())
+        else:
+            hasher.update(repr(obj.name).encode())
+    elif isinstance(obj, np.ndarray):
+        hasher.update(f"{obj.dtype}{obj.shape}".encode())
+        hasher.update(np.ascontiguousarray(obj).tobytes())
+    elif isinstance(obj, dict):
+        for key in sorted(obj, key=repr):
+            hasher.update(repr(key).encode())
+            _update_hash(hasher, obj[key])
+    elif isinstance(obj, (list, tuple)):
+        hasher.update(f"{type(obj).__name__}{len(obj)}".encode())
+        for item in obj:
+            _update_hash(hasher, item)
+    else:
+        hasher.update(repr(obj).encode())
+
+def compute_data_hash(plot_func, args: tuple, kwargs: dict) -> str:
+    """
+    Calcule une empreinte SHA-256 des données et paramètres d'un graphique.
+
+    Args:
+        plot_func (callable): Fonction de tracé.
+        args (tuple): Arguments positionnels passés à la fonction.
+        kwargs (dict): Arguments nommés passés à la fonction.
+
+    Returns:
+        str: Empreinte hexadécimale.
+    """
+    hasher = hashlib.sha256()
+    hasher.update(f"{plot_func.__module__}.{plot_func.__qualname__}".encode())
+    _update_hash(hasher, args)
+    _update_hash(hasher, kwargs)
+    return hasher.hexdigest()
+
+class ReportEngine:
+    """
+    Moteur de reporting qui rend les graphiques en parallèle dans un pool de processus.
+
+    Les graphiques sont soumis sans bloquer le pipeline de prévision; un graphique dont
+    les données d'entrée n'ont pas changé depuis le dernier rendu (même empreinte et
+    fichier présent) n'est pas redessiné. `finalize` attend les rendus en cours et
+    produit un rapport consolidé Markdown et HTML.
+    """
+
+    def __init__(self, output_dir: str = "reports", max_workers: int = None):
+        """
+        Args:
+            output_dir (str): Dossier des graphiques et rapports générés.
+            max_workers (int): Nombre de processus de rendu (par défaut, nombre de CPU).
+        """
+        self.output_dir = output_dir
+        os.makedirs(output_dir, exist_ok=True)
+        self.cache_path = os.path.join(output_dir, CACHE_FILE_NAME)
+        self._cache = self._load_cache()
+        self._executor = ProcessPoolExecutor(max_workers=max_workers,
+                                             mp_context=self._get_mp_context(),
+                                             initializer=_init_worker)
+        self._pending = {}
+        self._charts = {}
+        self._sections = []
+
+    @staticmethod
+    def _get_mp_context():
+        # "forkserver" ne copie pas l'état du processus principal (threads XGBoost, session Refinitiv):
+        # les modules préchargés sont importés une fois par le serveur, puis hérités par chaque worker.
+        # "spawn" sert de repli hors Unix.
+        if "forkserver" in multiprocessing.get_all_start_methods():
+            context = multiprocessing.get_context("forkserver")
+            context.set_forkserver_preload(WORKER_PRELOAD_MODULES)
+            return context
+        return multiprocessing.get_context("spawn")
+
+    def _load_cache(self) -> dict:
+        if not os.path.exists(self.cache_path):
+            return {}
+        try:
+            with open(self.cache_path, "r", encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError) as e:
+            logger.warning(f"Cache des graphiques illisible ({e}), tous les graphiques seront redessinés.")
+            return {}
+
+    def _save_cache(self):
+        with open(self.cache_path, "w", encoding="utf-8") as f:
+            json.dump(self._cache, f, indent=2, sort_keys=True)
+
+    def _record_finished_renders(self):
+        # Seuls les rendus terminés sans erreur sont enregistrés dans le cache
+        for name, (future, data_hash) in self._pending.items():
+            if future.cancelled():
+                continue
+            error = future.exception()
+            if error is not None:
+                logger.error(f"Erreur lors du rendu du graphique '{name}': {error}")
+                self._charts.pop(name, None)
+            else:
+                self._cache[name] = data_hash
+        self._pending = {}
+        self._save_cache()
+
+    def submit_chart(self, name: str, title: str, plot_func, *args, **kwargs):
+        """
+        Soumet un graphique au pool de rendu sans attendre sa génération.
+
+        Si un graphique du même nom est encore en cours de rendu, ce rendu est annulé
+        (ou attendu s'il a déjà démarré) avant la nouvelle soumission.
+
+        Args:
+            name (str): Identifiant unique du graphique (nom du fichier PNG, sans extension).
+            title (str): Titre du graphique, utilisé aussi dans le rapport.
+            plot_func (callable): Fonction de tracé de niveau module (ex. `visualizer.plot_cumulative_pnl`),
+                acceptant `title` et `output_path`.
+            *args: Données passées à la fonction de tracé.
+            **kwargs: Paramètres supplémentaires de la fonction de tracé.
+
+        Returns:
+            concurrent.futures.Future | None: Rendu en cours, ou None si le graphique est à jour.
+        """
+        output_path = os.path.join(self.output_dir, f"{name}.png")
+        kwargs = dict(kwargs, title=title, output_path=output_path)
+        data_hash = compute_data_hash(plot_func, args, kwargs)
+        self._charts[name] = (title, output_path)
+
+        previous = self._pending.pop(name, None)
+        if previous is not None and not previous[0].cancel():
+            wait([previous[0]])
+
+        if self._cache.get(name) == data_hash and os.path.exists(output_path):
+            logger.info(f"Graphique '{title}' inchangé, rendu ignoré.")
+            return None
+
+        # Le PNG va être réécrit: l'entrée du cache est retirée (et persistée) avant le rendu,
+        # pour qu'une exécution interrompue ne laisse pas une empreinte décrivant un autre graphique.
+        if self._cache.pop(name, None) is not None:
+            self._save_cache()
+
+        future = self._executor.submit(plot_func, *args, **kwargs)
+        self._pending[name] = (future, data_hash)
+        return future
+
+    def add_section(self, title: str, metrics: dict):
+        """
+        Ajoute une section de métriques au rapport consolidé, à la suite des précédentes.
+
+        Args:
+            title (str): Titre de la section.
+            metrics (dict): Métriques à afficher.
+        """
+        self._sections.append((title, metrics))
+
+    def finalize(self, report_name: str = "report", title: str = "Rapport de Prédiction des Prix de l'Énergie") -> dict:
+        """
+        Attend les rendus en cours, met à jour le cache et écrit le rapport consolidé.
+
+        Args:
+            report_name (str): Nom des fichiers de rapport (sans extension).
+            title (str): Titre du rapport.
+
+        Returns:
+            dict: Chemins des rapports générés, sous la forme {"markdown": ..., "html": ...}.
+        """
+        wait([future for future, _ in self._pending.values()])
+        self._record_finished_renders()
+
+        charts = [(name, chart_title, path) for name, (chart_title, path) in self._charts.items()]
+        markdown_path = os.path.join(self.output_dir, f"{report_name}.md")
+        html_path = os.path.join(self.output_dir, f"{report_name}.html")
+        write_markdown_report(title, self._sections, charts, markdown_path)
+        write_html_report(title, self._sections, charts, html_path)
+        return {"markdown": markdown_path, "html": html_path}
+
+    def close(self, cancel_pending: bool = False):
+        """
+        Arrête le pool de processus de rendu et enregistre dans le cache les rendus terminés.
+
+        Args:
+            cancel_pending (bool): Annule les rendus qui n'ont pas encore démarré.
+        """
+        self._executor.shutdown(wait=True, cancel_futures=cancel_pending)
+        self._record_finished_renders()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        # En cas d'erreur dans le pipeline, inutile de terminer les rendus en attente
+        self.close(cancel_pending=exc_type is not None)
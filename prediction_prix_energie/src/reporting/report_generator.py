@@ -1,4 +1,6 @@
 import pandas as pd
+import html
+import os
 import logging
 
 logger = logging.getLogger(__name__)
@@ -17,4 +19,69 @@ def generate_performance_report(metrics: dict, output_path: str = "reports/perfo
             f.write(f"{key}: {value:.2f}\n")
     logger.info(f"Rapport de performance sauvegardé à {output_path}.")
 
+def _format_value(value) -> str:
+    if isinstance(value, (int, float)) and not isinstance(value, bool):
+        return f"{value:.2f}"
+    return str(value)
 
+def _relative_path(path: str, output_path: str) -> str:
+    return os.path.relpath(path, os.path.dirname(os.path.abspath(output_path))).replace(os.sep, "/")
+
+def write_markdown_report(title: str, sections: list, charts: list, output_path: str):
+    """
+    Écrit un rapport Markdown consolidé (tableaux de métriques et graphiques).
+
+    Args:
+        title (str): Titre du rapport.
+        sections (list): Sections de métriques, dans l'ordre, sous la forme [(titre_section, {métrique: valeur})].
+        charts (list): Graphiques à inclure, dans l'ordre, sous la forme [(nom, titre, chemin_image)].
+        output_path (str): Chemin où sauvegarder le rapport.
+    """
+    lines = [f"# {title}", ""]
+    for section_title, metrics in sections:
+        lines += [f"## {section_title}", "", "| Métrique | Valeur |", "|---|---|"]
+        lines += [f"| {key} | {_format_value(value)} |" for key, value in metrics.items()]
+        lines.append("")
+    if charts:
+        lines += ["## Graphiques", ""]
+        for name, chart_title, path in charts:
+            lines += [f"### {chart_title}", "", f"![{chart_title}]({_relative_path(path, output_path)})", ""]
+
+    with open(output_path, "w", encoding="utf-8") as f:
+        f.write("\n".join(lines))
+    logger.info(f"Rapport Markdown sauvegardé à {output_path}.")
+
+def write_html_report(title: str, sections: list, charts: list, output_path: str):
+    """
+    Écrit un rapport HTML consolidé (tableaux de métriques et graphiques).
+
+    Args:
+        title (str): Titre du rapport.
+        sections (list): Sections de métriques, dans l'ordre, sous la forme [(titre_section, {métrique: valeur})].
+        charts (list): Graphiques à inclure, dans l'ordre, sous la forme [(nom, titre, chemin_image)].
+        output_path (str): Chemin où sauvegarder le rapport.
+    """
+    parts = [
+        "<!DOCTYPE html>",
+        "<html lang=\"fr\">",
+        f"<head><meta charset=\"utf-8\"><title>{html.escape(title)}</title></head>",
+        "<body>",
+        f"<h1>{html.escape(title)}</h1>",
+    ]
+    for section_title, metrics in sections:
+        parts.append(f"<h2>{html.escape(section_title)}</h2>")
+        parts.append("<table border=\"1\"><tr><th>Métrique</th><th>Valeur</th></tr>")
+        parts += [f"<tr><td>{html.escape(str(key))}</td><td>{html.escape(_format_value(value))}</td></tr>"
+                  for key, value in metrics.items()]
+        parts.append("</table>")
+    if charts:
+        parts.append("<h2>Graphiques</h2>")
+        for name, chart_title, path in charts:
+            parts.append(f"<h3 id=\"{html.escape(name)}\">{html.escape(chart_title)}</h3>")
+            parts.append(f"<img src=\"{html.escape(_relative_path(path, output_path))}\" "
+                         f"alt=\"{html.escape(chart_title)}\" loading=\"lazy\">")
+    parts += ["</body>", "</html>"]
+
+    with open(output_path, "w", encoding="utf-8") as f:
+        f.write("\n".join(parts))
+    logger.info(f"Rapport HTML sauvegardé à {output_path}.")
@@ -1,48 +1,174 @@
+import os
 import matplotlib.pyplot as plt
 import seaborn as sns
+import numpy as np
 import pandas as pd
 import logging
 
 logger = logging.getLogger(__name__)
 
-def plot_predictions(actual_prices: pd.Series, predicted_prices: pd.Series, title: str = "Prédictions vs Réalité"):
+DEFAULT_MAX_POINTS = 2000
+
+def lttb_indices(series: pd.Series, threshold: int = DEFAULT_MAX_POINTS) -> np.ndarray:
+    """
+    Calcule les positions retenues par l'algorithme LTTB (Largest-Triangle-Three-Buckets).
+
+    Conserve le premier et le dernier point, puis garde dans chaque intervalle le point
+    formant le plus grand triangle avec le point retenu précédemment et la moyenne de
+    l'intervalle suivant, ce qui préserve les pics visibles sur le graphique.
+
+    Args:
+        series (pd.Series): Série sans valeurs manquantes.
+        threshold (int): Nombre maximal de points à conserver.
+
+    Returns:
+        np.ndarray: Positions (utilisables avec `.iloc`) des points retenus, dans l'ordre.
+    """
+    n = len(series)
+    if threshold is None or threshold < 3 or n <= threshold:
+        return np.arange(n)
+
+    if isinstance(series.index, pd.DatetimeIndex):
+        x = series.index.asi8.astype(float)
+    elif pd.api.types.is_numeric_dtype(series.index):
+        x = series.index.to_numpy(dtype=float)
+    else:
+        x = np.arange(n, dtype=float)
+    y = series.to_numpy(dtype=float)
+
+    every = (n - 2) / (threshold - 2)
+    selected = np.empty(threshold, dtype=np.int64)
+    selected[0] = 0
+    a = 0
+    for i in range(threshold - 2):
+        avg_start = int(np.floor((i + 1) * every)) + 1
+        avg_end = min(int(np.floor((i + 2) * every)) + 1, n)
+        avg_x = x[avg_start:avg_end].mean()
+        avg_y = y[avg_start:avg_end].mean()
+
+        range_start = int(np.floor(i * every)) + 1
+        range_end = int(np.floor((i + 1) * every)) + 1
+        areas = np.abs(
+            (x[a] - avg_x) * (y[range_start:range_end] - y[a])
+            - (x[a] - x[range_start:range_end]) * (avg_y - y[a])
+        )
+        a = range_start + int(np.argmax(areas))
+        selected[i + 1] = a
+    selected[-1] = n - 1
+    return selected
+
+def lttb_downsample(series: pd.Series, threshold: int = DEFAULT_MAX_POINTS) -> pd.Series:
+    """
+    Sous-échantillonne une série avec l'algorithme LTTB, après suppression des valeurs manquantes.
+
+    Args:
+        series (pd.Series): Série à sous-échantillonner.
+        threshold (int): Nombre maximal de points à conserver.
+
+    Returns:
+        pd.Series: Série sous-échantillonnée (inchangée si elle est déjà assez courte).
+    """
+    series = series.dropna()
+    return series.iloc[lttb_indices(series, threshold)]
+
+def _save_figure(output_path: str, title: str):
+    output_dir = os.path.dirname(output_path)
+    if output_dir:
+        os.makedirs(output_dir, exist_ok=True)
+    plt.tight_layout()
+    plt.savefig(output_path)
+    plt.close()
+    logger.info(f"Graphique '{title}' sauvegardé à {output_path}.")
+
+def plot_predictions_vs_actual(actual_prices: pd.Series, predicted_prices, title: str, output_path: str,
+                               max_points: int = DEFAULT_MAX_POINTS) -> str:
     """
     Trace les prix réels et les prix prédits.
 
     Args:
         actual_prices (pd.Series): Série des prix réels.
-        predicted_prices (pd.Series): Série des prix prédits.
+        predicted_prices (pd.Series | np.ndarray): Prix prédits, alignés sur l'index des prix réels.
         title (str): Titre du graphique.
+        output_path (str): Chemin du fichier image.
+        max_points (int): Nombre maximal de points tracés (sous-échantillonnage LTTB calculé sur les prix
+            réels, les mêmes dates étant conservées pour les deux courbes).
+
+    Returns:
+        str: Chemin du graphique sauvegardé.
     """
+    if not isinstance(predicted_prices, pd.Series):
+        predicted_prices = pd.Series(np.asarray(predicted_prices), index=actual_prices.index)
+
+    prices = pd.DataFrame({'actual': actual_prices, 'predicted': predicted_prices}).dropna()
+    prices = prices.iloc[lttb_indices(prices['actual'], max_points)]
+
     plt.figure(figsize=(12, 6))
-    plt.plot(actual_prices.index, actual_prices, label=\'Prix Réels\', color=\'blue\')
-    plt.plot(predicted_prices.index, predicted_prices, label=\'Prix Prédits\', color=\'red\', linestyle=\'--\')
+    plt.plot(prices.index, prices['actual'], label='Prix Réels', color='blue')
+    plt.plot(prices.index, prices['predicted'], label='Prix Prédits', color='red', linestyle='--')
     plt.title(title)
-    plt.xlabel(\'Date\')
-    plt.ylabel(\'Prix\')
+    plt.xlabel('Date')
+    plt.ylabel('Prix')
     plt.legend()
     plt.grid(True)
-    plt.tight_layout()
-    plt.savefig(f"reports/{title.replace(\' \', \'_\').lower()}.png")
-    plt.close()
-    logger.info(f"Graphique \'{title}\' sauvegardé.")
+    _save_figure(output_path, title)
+    return output_path
+
+def plot_predictions(actual_prices: pd.Series, predicted_prices: pd.Series, title: str = "Prédictions vs Réalité"):
+    """
+    Trace les prix réels et les prix prédits dans `reports/`, sous un nom dérivé du titre.
+
+    Conservée pour compatibilité; préférer `plot_predictions_vs_actual` avec un chemin explicite.
+
+    Args:
+        actual_prices (pd.Series): Série des prix réels.
+        predicted_prices (pd.Series): Série des prix prédits.
+        title (str): Titre du graphique.
+    """
+    output_path = os.path.join("reports", f"{title.replace(' ', '_').lower()}.png")
+    return plot_predictions_vs_actual(actual_prices, predicted_prices, title, output_path)
 
-def plot_feature_importance(feature_importances: pd.Series, title: str = "Importance des Caractéristiques"):
+def plot_feature_importance(feature_importances: pd.Series, title: str, output_path: str) -> str:
     """
-    Trace l\'importance des caractéristiques.
+    Trace l'importance des caractéristiques.
 
     Args:
         feature_importances (pd.Series): Série des importances des caractéristiques.
         title (str): Titre du graphique.
+        output_path (str): Chemin du fichier image.
+
+    Returns:
+        str: Chemin du graphique sauvegardé.
     """
     plt.figure(figsize=(10, 8))
     sns.barplot(x=feature_importances.values, y=feature_importances.index)
     plt.title(title)
-    plt.xlabel(\'Importance\')
-    plt.ylabel(\'Caractéristique\')
-    plt.tight_layout()
-    plt.savefig(f"reports/{title.replace(\' \', \'_\').lower()}.png")
-    plt.close()
-    logger.info(f"Graphique \'{title}\' sauvegardé.")
+    plt.xlabel('Importance')
+    plt.ylabel('Caractéristique')
+    _save_figure(output_path, title)
+    return output_path
+
+def plot_cumulative_pnl(cumulative_pnl: pd.Series, title: str, output_path: str,
+                        max_points: int = DEFAULT_MAX_POINTS) -> str:
+    """
+    Trace le PnL cumulé d'une stratégie.
+
+    Args:
+        cumulative_pnl (pd.Series): Série du PnL cumulé.
+        title (str): Titre du graphique.
+        output_path (str): Chemin du fichier image.
+        max_points (int): Nombre maximal de points tracés (sous-échantillonnage LTTB).
 
+    Returns:
+        str: Chemin du graphique sauvegardé.
+    """
+    pnl_plot = lttb_downsample(cumulative_pnl, max_points)
 
+    plt.figure(figsize=(12, 6))
+    plt.plot(pnl_plot.index, pnl_plot, color='green')
+    plt.axhline(0, color='grey', linewidth=0.8)
+    plt.title(title)
+    plt.xlabel('Date')
+    plt.ylabel('PnL Cumulé')
+    plt.grid(True)
+    _save_figure(output_path, title)
+    return output_path
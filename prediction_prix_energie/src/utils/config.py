@@ -25,6 +25,11 @@ class Config:
     RANDOM_STATE = 42
     TARGET_COLUMN = "Close"
 
+    # Paramètres de reporting
+    REPORTS_DIR = "reports"
+    REPORT_MAX_WORKERS = None  # None: un processus de rendu par CPU
+    CHART_MAX_POINTS = 2000  # Points tracés par série après sous-échantillonnage LTTB
+
     # Paramètres de logging
     LOG_FILE = "app.log"
     LOG_LEVEL = "INFO"
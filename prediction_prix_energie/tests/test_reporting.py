@@ -0,0 +1,181 @@
+import json
+import logging
+import matplotlib
+matplotlib.use("Agg")
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.reporting.report_engine import ReportEngine, CACHE_FILE_NAME
+from src.reporting.report_generator import write_markdown_report, write_html_report
+from src.reporting import visualizer
+from src.reporting.visualizer import lttb_downsample, plot_cumulative_pnl, plot_predictions_vs_actual
+
+# Les fonctions de tracé soumises au pool doivent être de niveau module pour être sérialisables
+def _write_sum(series: pd.Series, title: str, output_path: str) -> str:
+    with open(output_path, "w") as f:
+        f.write(f"{title}:{series.sum()}")
+    return output_path
+
+def _failing_plot(series: pd.Series, title: str, output_path: str) -> str:
+    raise ValueError("tracé impossible")
+
+@pytest.fixture
+def daily_series():
+    index = pd.date_range("2023-01-01", periods=100, freq="D")
+    return pd.Series(np.arange(100, dtype=float), index=index)
+
+def test_lttb_downsample_keeps_threshold_points_and_bounds():
+    index = pd.date_range("2020-01-01", periods=10_000, freq="h")
+    series = pd.Series(np.sin(np.linspace(0, 50, 10_000)), index=index)
+
+    sampled = lttb_downsample(series, 500)
+
+    assert len(sampled) == 500
+    assert sampled.index[0] == series.index[0]
+    assert sampled.index[-1] == series.index[-1]
+    assert sampled.index.is_monotonic_increasing
+
+def test_lttb_downsample_keeps_isolated_spike():
+    series = pd.Series(np.zeros(1000))
+    series.iloc[537] = 100.0
+
+    sampled = lttb_downsample(series, 50)
+
+    assert 537 in sampled.index
+    assert sampled.max() == 100.0
+
+def test_lttb_downsample_returns_short_series_unchanged():
+    series = pd.Series([1.0, 2.0, 3.0])
+    pd.testing.assert_series_equal(lttb_downsample(series, 10), series)
+
+def test_plot_predictions_vs_actual_downsamples_both_lines_on_same_dates(tmp_path, monkeypatch):
+    close_figures = visualizer.plt.close
+    monkeypatch.setattr(visualizer.plt, "close", lambda *args: None)
+    index = pd.date_range("2020-01-01", periods=5000, freq="h")
+    rng = np.random.default_rng(0)
+    actual = pd.Series(rng.normal(size=5000).cumsum(), index=index)
+    predicted = actual + rng.normal(scale=5.0, size=5000)
+
+    plot_predictions_vs_actual(actual, predicted.to_numpy(), "Prix", str(tmp_path / "prix.png"), max_points=200)
+
+    actual_line, predicted_line = visualizer.plt.gca().get_lines()
+    assert len(actual_line.get_xdata()) == 200
+    np.testing.assert_array_equal(actual_line.get_xdata(), predicted_line.get_xdata())
+    close_figures("all")
+
+def test_plot_cumulative_pnl_writes_to_output_path(tmp_path, daily_series):
+    output_path = tmp_path / "pnl" / "cumulative_pnl.png"
+    assert plot_cumulative_pnl(daily_series.cumsum(), "PnL", str(output_path), max_points=20) == str(output_path)
+    assert output_path.exists()
+
+def test_submit_chart_skips_unchanged_data_and_rerenders_changed_data(tmp_path, daily_series):
+    with ReportEngine(str(tmp_path), max_workers=1) as engine:
+        assert engine.submit_chart("pnl", "PnL", _write_sum, daily_series) is not None
+        engine.finalize()
+
+        assert engine.submit_chart("pnl", "PnL", _write_sum, daily_series) is None
+
+        future = engine.submit_chart("pnl", "PnL", _write_sum, daily_series * 2)
+        assert future is not None
+        engine.finalize()
+
+    assert (tmp_path / "pnl.png").read_text() == f"PnL:{(daily_series * 2).sum()}"
+
+def test_cache_persists_across_engines(tmp_path, daily_series):
+    with ReportEngine(str(tmp_path), max_workers=1) as engine:
+        engine.submit_chart("pnl", "PnL", _write_sum, daily_series)
+        engine.finalize()
+
+    with ReportEngine(str(tmp_path), max_workers=1) as engine:
+        assert engine.submit_chart("pnl", "PnL", _write_sum, daily_series) is None
+        (tmp_path / "pnl.png").unlink()
+        assert engine.submit_chart("pnl", "PnL", _write_sum, daily_series) is not None
+        engine.finalize()
+
+def test_interrupted_run_does_not_leave_stale_cache_entry(tmp_path, daily_series):
+    with ReportEngine(str(tmp_path), max_workers=1) as engine:
+        engine.submit_chart("pnl", "PnL", _write_sum, daily_series)
+        engine.finalize()
+
+    # Exécution interrompue avant finalize: le PNG est réécrit avec d'autres données
+    with pytest.raises(RuntimeError):
+        with ReportEngine(str(tmp_path), max_workers=1) as engine:
+            engine.submit_chart("pnl", "PnL", _write_sum, daily_series * 2).result()
+            raise RuntimeError("échec du pipeline")
+
+    with ReportEngine(str(tmp_path), max_workers=1) as engine:
+        assert engine.submit_chart("pnl", "PnL", _write_sum, daily_series) is not None
+        engine.finalize()
+
+    assert (tmp_path / "pnl.png").read_text() == f"PnL:{daily_series.sum()}"
+
+def test_close_records_finished_renders_without_finalize(tmp_path, daily_series):
+    with ReportEngine(str(tmp_path), max_workers=1) as engine:
+        engine.submit_chart("pnl", "PnL", _write_sum, daily_series)
+
+    with ReportEngine(str(tmp_path), max_workers=1) as engine:
+        assert engine.submit_chart("pnl", "PnL", _write_sum, daily_series) is None
+
+def test_resubmitting_pending_chart_keeps_latest_render(tmp_path, daily_series):
+    with ReportEngine(str(tmp_path), max_workers=2) as engine:
+        engine.submit_chart("pnl", "PnL", _write_sum, daily_series)
+        engine.submit_chart("pnl", "PnL", _write_sum, daily_series + 1)
+        engine.finalize()
+
+        assert (tmp_path / "pnl.png").read_text() == f"PnL:{(daily_series + 1).sum()}"
+        assert engine.submit_chart("pnl", "PnL", _write_sum, daily_series + 1) is None
+        assert engine.submit_chart("pnl", "PnL", _write_sum, daily_series) is not None
+        engine.finalize()
+
+def test_failing_chart_is_logged_and_left_out_of_report(tmp_path, daily_series, caplog):
+    with ReportEngine(str(tmp_path), max_workers=1) as engine:
+        engine.submit_chart("ok", "Graphique valide", _write_sum, daily_series)
+        engine.submit_chart("broken", "Graphique en erreur", _failing_plot, daily_series)
+        with caplog.at_level(logging.ERROR, logger="src.reporting.report_engine"):
+            paths = engine.finalize("report")
+
+    assert any("broken" in record.getMessage() for record in caplog.records)
+    for path in paths.values():
+        content = open(path, encoding="utf-8").read()
+        assert "Graphique valide" in content
+        assert "Graphique en erreur" not in content
+    cache = json.loads((tmp_path / CACHE_FILE_NAME).read_text())
+    assert "ok" in cache and "broken" not in cache
+
+def test_charts_with_same_title_are_all_reported(tmp_path, daily_series):
+    with ReportEngine(str(tmp_path), max_workers=2) as engine:
+        engine.submit_chart("pnl_fr", "PnL Cumulé", _write_sum, daily_series)
+        engine.submit_chart("pnl_de", "PnL Cumulé", _write_sum, daily_series + 1)
+        paths = engine.finalize("report")
+
+    markdown = open(paths["markdown"], encoding="utf-8").read()
+    assert "pnl_fr.png" in markdown and "pnl_de.png" in markdown
+
+def test_sections_with_same_title_are_all_reported(tmp_path):
+    with ReportEngine(str(tmp_path), max_workers=1) as engine:
+        engine.add_section("Performance du Modèle", {"Marché": "FR", "RMSE": 1.0})
+        engine.add_section("Performance du Modèle", {"Marché": "DE", "RMSE": 2.0})
+        paths = engine.finalize("report")
+
+    for path in paths.values():
+        content = open(path, encoding="utf-8").read()
+        assert content.count("Performance du Modèle") == 2
+        assert "FR" in content and "DE" in content
+
+def test_report_writers_include_sections_and_relative_chart_paths(tmp_path):
+    sections = [("Performance du Modèle", {"RMSE": 1.234, "Modèle": "xgboost"})]
+    charts = [("pnl", "PnL <Cumulé>", str(tmp_path / "charts" / "pnl.png"))]
+
+    write_markdown_report("Rapport", sections, charts, str(tmp_path / "report.md"))
+    write_html_report("Rapport", sections, charts, str(tmp_path / "report.html"))
+
+    markdown = (tmp_path / "report.md").read_text(encoding="utf-8")
+    assert "| RMSE | 1.23 |" in markdown
+    assert "| Modèle | xgboost |" in markdown
+    assert "(charts/pnl.png)" in markdown
+
+    html_report = (tmp_path / "report.html").read_text(encoding="utf-8")
+    assert "<td>1.23</td>" in html_report
+    assert "PnL &lt;Cumulé&gt;" in html_report
+    assert "src=\"charts/pnl.png\"" in html_report